@@ -35,7 +35,8 @@ import math
 import random
 import sys
 from array import array
-from collections import deque
+from bisect import bisect_left
+from functools import lru_cache
 
 import pygame
 
@@ -43,11 +44,16 @@ import pygame
 W, H = 960, 540
 FPS = 60
 TAU = getattr(math, "tau", 2.0 * math.pi)
+INV_SQRT2 = 1.0 / math.sqrt(2.0)
 CENTER = pygame.Vector2(W/2, H/2)
 
 # ---------- Circuit/Grid ----------
 GRID = 48                # spacing for circuit lines
 JUNC_TOL = 6             # intersection tolerance in px
+INV_GRID = 1.0 / GRID
+CARDINALS = ((1, 0), (-1, 0), (0, 1), (0, -1))   # unit (dx, dy) directions along the wires
+H_CARD = CARDINALS[:2]
+V_CARD = CARDINALS[2:]
 
 # ---------- Hero ----------
 HERO_R = 8
@@ -62,6 +68,7 @@ SURGE_LEN = 1.9          # seconds lifetime
 SURGE_SPEED_PLAYER = 560
 SURGE_SPEED_ENEMY = 460
 SURGE_SPEED_NATURAL = 520
+TRAIL_LEN = 12           # trail samples kept per surge
 
 # ---------- Overclock (BLAST) ----------
 # Harder to earn:
@@ -81,6 +88,8 @@ OC_BLAST_SHAKE_STRENGTH = 6.0
 VIRUS_BASE_R = 22
 BUG_R = 14
 WORM_R = 18
+MITOSIS_CELL = 2 * max(VIRUS_BASE_R, BUG_R, WORM_R)  # spatial-hash cell for same-type touch tests
+HIT_CELL = VIRUS_BASE_R + OC_SURGE_R  # largest enemy/surge reach, so a 3x3 cell query sees every hit
 
 VIRUS_SPEED = 90
 BUG_SPEED = 150
@@ -102,6 +111,7 @@ SHAKE_DECAY = 40.0
 SHAKE_HIT = 3.5
 SHAKE_SHOOT = 1.0
 BLOOM_DOWNSCALE = 2
+DIRTY_PAD = 4 * BLOOM_DOWNSCALE   # bloom bleeds a changed pixel this far (x2) into its neighbours
 
 # ---------- Colors ----------
 VERY_DARK   = (10, 12, 16)
@@ -123,68 +133,127 @@ def clamp(v, a, b):
 def near_grid(v, spacing=GRID, tol=JUNC_TOL):
     return abs(v - round(v/spacing)*spacing) <= tol
 
-def at_intersection(p):
-    return near_grid(p.x) and near_grid(p.y)
-
-def snap_axis(p, dirv):
-    """Snap position to nearest complementary grid line (stay on 'wire')."""
-    xg = round(p.x / GRID) * GRID
-    yg = round(p.y / GRID) * GRID
-    if abs(dirv.x) > 0:    # moving horiz -> lock Y
-        p.y = yg
-    if abs(dirv.y) > 0:    # moving vert -> lock X
-        p.x = xg
-
-def cardinal_from(v):
-    if v.length_squared() == 0:
-        return pygame.Vector2(1, 0)
-    if abs(v.x) >= abs(v.y):
-        return pygame.Vector2(1 if v.x >= 0 else -1, 0)
-    else:
-        return pygame.Vector2(0, 1 if v.y >= 0 else -1)
+def within(ax, ay, bx, by, r):
+    """Distance test without the sqrt: |a - b| <= r."""
+    dx = ax - bx
+    dy = ay - by
+    return dx*dx + dy*dy <= r*r
+
+def at_intersection(x, y):
+    return near_grid(x) and near_grid(y)
+
+def snap_axis(x, y, dx, dy, inv=INV_GRID, g=GRID):
+    """Snap (x, y) to the complementary grid line for direction (dx, dy) (stay on 'wire')."""
+    if dx:    # moving horiz -> lock Y
+        y = round(y * inv) * g
+    if dy:    # moving vert -> lock X
+        x = round(x * inv) * g
+    return x, y
+
+def cardinal_from(vx, vy):
+    """Nearest wire direction as a (dx, dy) tuple; ties and zero favour +x."""
+    if abs(vx) >= abs(vy):
+        return (1 if vx >= 0 else -1, 0)
+    return (0, 1 if vy >= 0 else -1)
+
+_ri = random.randint
 
 def rand_between(a_b):
     return random.uniform(a_b[0], a_b[1])
 
+def compact(lst, keep):
+    """Drop the items failing keep(item) in place, preserving order."""
+    w = 0
+    for item in lst:
+        if keep(item):
+            lst[w] = item
+            w += 1
+    del lst[w:]
+
 # ---------- Tiny tone synth (no numpy) ----------
+# Direct digital synthesis: a fixed-point phase accumulator indexes one
+# precomputed sine period instead of calling math.sin per sample.
+SIN_BITS = 12
+SIN_SIZE = 1 << SIN_BITS
+SIN_MASK = SIN_SIZE - 1
+SIN_TABLE = array("d", [math.sin(TAU * i / SIN_SIZE) for i in range(SIN_SIZE)])
+PHASE_FRAC = 16          # fractional bits of the phase accumulator
+
+def phase_step(freq, samplerate):
+    return int(freq * (SIN_SIZE << PHASE_FRAC) / samplerate)
+
 def make_tone(freq=440.0, duration=0.08, volume=0.45, samplerate=22050):
     n = int(duration * samplerate)
     amp = int(32767 * max(0.0, min(1.0, volume)))
-    buf = array("h", [0] * n)
-    two_pi_f = 2.0 * math.pi * freq
-    for i in range(n):
-        s = int(amp * math.sin(two_pi_f * (i / samplerate)))
-        buf[i] = s
+    step = phase_step(freq, samplerate)
+    tbl = SIN_TABLE
+    buf = array("h", [int(amp * tbl[(i * step >> PHASE_FRAC) & SIN_MASK]) for i in range(n)])
     return pygame.mixer.Sound(buffer=buf.tobytes())
 
 def make_dual_tone(f1=440, f2=660, duration=0.09, volume=0.5, samplerate=22050):
     n = int(duration * samplerate)
     amp = int(32767 * max(0.0, min(1.0, volume))) // 2
-    buf = array("h", [0] * n)
-    two_pi_1 = 2.0 * math.pi * f1
-    two_pi_2 = 2.0 * math.pi * f2
-    for i in range(n):
-        s = int(amp * math.sin(two_pi_1 * (i / samplerate))) + int(amp * math.sin(two_pi_2 * (i / samplerate)))
-        buf[i] = s
+    step1 = phase_step(f1, samplerate)
+    step2 = phase_step(f2, samplerate)
+    tbl = SIN_TABLE
+    buf = array("h", [int(amp * (tbl[(i * step1 >> PHASE_FRAC) & SIN_MASK] + tbl[(i * step2 >> PHASE_FRAC) & SIN_MASK]))
+                      for i in range(n)])
     return pygame.mixer.Sound(buffer=buf.tobytes())
 
 # ---------- Visual helpers ----------
+# Long-lived surfaces are converted to the display format once (convert / convert_alpha).
 def make_scanlines(w, h, spacing=4, alpha=28):
-    surf = pygame.Surface((w, h), pygame.SRCALPHA)
-    for y in range(0, h, spacing):
-        pygame.draw.line(surf, (0, 0, 0, alpha), (0, y), (w, y))
-    return surf
+    """Grey row tiled every `spacing` px as (surface, dest) pairs, for a BLEND_RGB_MULT batch."""
+    k = 255 - alpha
+    row = pygame.Surface((w, 1)).convert()
+    row.fill((k, k, k))
+    return [(row, (0, y)) for y in range(0, h, spacing)]
+
+def blit_batch(surf, seq, flags=0):
+    """Submit a whole (source, dest) sequence in one call: fblits on pygame-ce, blits otherwise."""
+    if hasattr(surf, "fblits"):
+        surf.fblits(seq, flags)
+    elif flags:
+        surf.blits([(src, dest, None, flags) for src, dest in seq], doreturn=False)
+    else:
+        surf.blits(seq, doreturn=False)
+
+def make_dot_sprite(r, color):
+    """Solid dot matching pygame.draw.circle(surf, color, center, r), blitted at center - r."""
+    ds = pygame.Surface((r * 2 + 1, r * 2 + 1), pygame.SRCALPHA)
+    pygame.draw.circle(ds, color, (r, r), r)
+    return ds.convert_alpha()
+
+@lru_cache(maxsize=128)
+def neon_text(font, text, color, glow_color):
+    """Glow ring and face of a HUD string composited into one surface."""
+    g = font.render(text, True, glow_color)
+    t = font.render(text, True, color)
+    w, h = t.get_size()
+    ns = pygame.Surface((w + 2, h + 2), pygame.SRCALPHA)
+    for dx, dy in ((0,1),(2,1),(1,0),(1,2)):
+        ns.blit(g, (dx, dy))
+    ns.blit(t, (1, 1))
+    return ns.convert_alpha()
 
 def draw_neon_text(surf, text, font, pos, color, glow_color=None):
     if glow_color is None:
         glow_color = color
-    g = font.render(text, True, glow_color)
-    for dx, dy in ((-1,0),(1,0),(0,-1),(0,1)):
-        surf.blit(g, (pos[0] + dx, pos[1] + dy))
-    t = font.render(text, True, color)
-    surf.blit(t, pos)
+    surf.blit(neon_text(font, text, color, glow_color), (pos[0] - 1, pos[1] - 1))
+
+GLITCH_STEPS = 16        # fade levels baked for the glitch hazard square
+
+def make_glitch_sprites():
+    """Glitch squares from faintest to full strength (alpha up to 200)."""
+    sprites = []
+    for k in range(GLITCH_STEPS):
+        gs = pygame.Surface((10, 10), pygame.SRCALPHA)
+        gs.fill((255, 120, 255, int(200 * (k + 1) / GLITCH_STEPS)))
+        sprites.append(gs.convert_alpha())
+    return sprites
 
 class Particle:
+    __slots__ = ("pos","vel","life","age","color","size")
     def __init__(self, pos, vel, life, color, size=2):
         self.pos = pygame.Vector2(pos)
         self.vel = pygame.Vector2(vel)
@@ -197,65 +266,72 @@ class Particle:
         self.pos += self.vel * dt
         self.vel *= 0.985
         return self.age < self.life
-    def draw(self, surf):
-        t = clamp(1.0 - self.age / self.life, 0.0, 1.0)
-        r = int(clamp(self.color[0] * t + 5 * t, 0, 255))
-        g = int(clamp(self.color[1] * t + 5 * t, 0, 255))
-        b = int(clamp(self.color[2] * t + 5 * t, 0, 255))
-        a = int(clamp(255 * t, 0, 255))
-        col = (r, g, b, a)
-        s = max(1, int(self.size))
-        ps = pygame.Surface((s * 2, s * 2), pygame.SRCALPHA)
-        pygame.draw.circle(ps, col, (s, s), s)
-        surf.blit(ps, (int(self.pos.x - s), int(self.pos.y - s)))
 
 # ---------- Audio ----------
 class SFX:
+    # key -> (synth, args). Each Sound is synthesized on its first play and
+    # cached, so startup doesn't stall on generating the whole set.
+    TONES = {
+        "menu":      (make_dual_tone, (420, 840, 0.12, 0.45)),
+        "fire":      (make_tone, (980, 0.05, 0.5)),
+        "enemyfire": (make_tone, (360, 0.06, 0.45)),
+        "cancel":    (make_dual_tone, (700, 1200, 0.06, 0.5)),
+        "hit":       (make_tone, (1150, 0.05, 0.55)),
+        "hurt":      (make_tone, (160, 0.16, 0.5)),
+        "explode":   (make_dual_tone, (260, 180, 0.12, 0.48)),
+        "over_on":   (make_dual_tone, (900, 1200, 0.18, 0.5)),
+        "over_off":  (make_dual_tone, (400, 220, 0.15, 0.45)),
+        "win":       (make_dual_tone, (760, 1010, 0.2, 0.48)),
+        "lose":      (make_tone, (120, 0.35, 0.45)),
+        "natural":   (make_tone, (520, 0.05, 0.4)),
+        "clone":     (make_dual_tone, (660, 990, 0.08, 0.5)),
+    }
+
     def __init__(self):
         self.enabled = False
+        self._cache = {}
         try:
             pygame.mixer.pre_init(22050, -16, 1, 256)
             pygame.mixer.init()
             self.enabled = pygame.mixer.get_init() is not None
         except Exception:
             self.enabled = False
-        if not self.enabled:
-            return
-        try:
-            self.s_menu      = make_dual_tone(420, 840, 0.12, 0.45)
-            self.s_fire      = make_tone(980, 0.05, 0.5)
-            self.s_enemyfire = make_tone(360, 0.06, 0.45)
-            self.s_cancel    = make_dual_tone(700, 1200, 0.06, 0.5)
-            self.s_hit       = make_tone(1150, 0.05, 0.55)
-            self.s_hurt      = make_tone(160, 0.16, 0.5)
-            self.s_explode   = make_dual_tone(260, 180, 0.12, 0.48)
-            self.s_over_on   = make_dual_tone(900, 1200, 0.18, 0.5)
-            self.s_over_off  = make_dual_tone(400, 220, 0.15, 0.45)
-            self.s_win       = make_dual_tone(760, 1010, 0.2, 0.48)
-            self.s_lose      = make_tone(120, 0.35, 0.45)
-            self.s_natural   = make_tone(520, 0.05, 0.4)
-            self.s_clone     = make_dual_tone(660, 990, 0.08, 0.5)
-        except Exception:
-            self.enabled = False
 
     def play(self, key):
         if not self.enabled: return
-        m = {
-            "menu": self.s_menu, "fire": self.s_fire, "enemyfire": self.s_enemyfire,
-            "cancel": self.s_cancel, "hit": self.s_hit, "hurt": self.s_hurt,
-            "explode": self.s_explode, "over_on": self.s_over_on, "over_off": self.s_over_off,
-            "win": self.s_win, "lose": self.s_lose, "natural": self.s_natural,
-            "clone": self.s_clone,
-        }
-        s = m.get(key)
-        if s: s.play()
+        s = self._cache.get(key)
+        if s is None:
+            spec = self.TONES.get(key)
+            if spec is None: return
+            try:
+                s = self._cache[key] = spec[0](*spec[1])
+            except Exception:
+                self.enabled = False
+                return
+        s.play()
 
 # ---------- Surges ----------
+TRAIL_LUT = {}  # (base color, trail length) -> faded color per trail point, filled on first use
+
+def trail_colors(color, n):
+    cols = TRAIL_LUT.get((color, n))
+    if cols is None:
+        cols = TRAIL_LUT[(color, n)] = [
+            (int(color[0] * (1 - t) + 40 * t),
+             int(color[1] * (1 - t) + 40 * t),
+             int(color[2] * (1 - t) + 40 * t))
+            for t in [i / n for i in range(n)]
+        ]
+    return cols
+
+FRIENDLY_OWNERS = ("player", "oc")   # surges that cancel hostile ones and hurt enemies
+
 class Surge:
-    __slots__ = ("pos","dir","speed","ttl","owner","color","r","trail","dmg","pierce")
+    __slots__ = ("x","y","dx","dy","speed","ttl","owner","color","r","trail","trail_head","trail_n","dmg","pierce")
     def __init__(self, pos, dirv, speed, owner, color, r=SURGE_R, ttl=SURGE_LEN, dmg=1, pierce=False):
-        self.pos = pygame.Vector2(pos)
-        self.dir = pygame.Vector2(cardinal_from(dirv))
+        # plain numbers instead of Vector2: integrate_surges moves them in one pass
+        self.x, self.y = float(pos[0]), float(pos[1])
+        self.dx, self.dy = dirv  # cardinal (dx, dy), see CARDINALS
         self.speed = speed
         self.owner = owner  # "player", "enemy", "natural", "oc"
         self.color = color
@@ -263,63 +339,73 @@ class Surge:
         self.ttl = ttl
         self.dmg = dmg
         self.pierce = pierce
-        self.trail = deque(maxlen=12)
-
-    def update(self, dt):
-        self.trail.append(self.pos.copy())
-        self.pos += self.dir * self.speed * dt
-        self.ttl -= dt
-        # stay on a grid wire
-        snap_axis(self.pos, self.dir)
-        return self.ttl > 0 and (-20 < self.pos.x < W+20) and (-20 < self.pos.y < H+20)
-
-    def draw(self, surf):
-        # trail blend
-        if len(self.trail) > 2:
-            for i in range(1, len(self.trail)):
-                a = self.trail[i - 1]
-                b = self.trail[i]
-                t = i / len(self.trail)
-                col = (
-                    int(self.color[0] * (1 - t) + 40 * t),
-                    int(self.color[1] * (1 - t) + 40 * t),
-                    int(self.color[2] * (1 - t) + 40 * t),
-                )
-                pygame.draw.line(surf, col, a, b, 2 if not self.pierce else 3)
-        pygame.draw.circle(surf, self.color, (int(self.pos.x), int(self.pos.y)), self.r)
+        # ring buffer of past positions as flat x,y floats; trail_head is the next write slot
+        self.trail = array("f", [0.0]) * (2 * TRAIL_LEN)
+        self.trail_head = 0
+        self.trail_n = 0
+
+    def sprite(self, cache):
+        key = (self.r, self.color)
+        ds = cache.get(key)
+        if ds is None:
+            ds = cache[key] = make_dot_sprite(self.r, self.color)
+        return ds, (int(self.x) - self.r, int(self.y) - self.r)
 
 # ---------- Enemies ----------
+QUARTER_TURN = TAU / 4
+ENEMY_ROT_STEPS = 32     # baked rotations per quarter turn (the diamond repeats every 90°)
+
+def make_enemy_sprites(r, color, width):
+    """Rotating diamond ring with its center dot, one frame per ENEMY_ROT_STEPS of a quarter turn."""
+    c = r + width + 1
+    frames = []
+    for k in range(ENEMY_ROT_STEPS):
+        ang = QUARTER_TURN * k / ENEMY_ROT_STEPS
+        ca, sa = math.cos(ang), math.sin(ang)
+        pts = [(c + px * ca - py * sa, c + px * sa + py * ca) for px, py in ((0,-r),(r,0),(0,r),(-r,0))]
+        es = pygame.Surface((c * 2 + 1, c * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.polygon(es, color, pts, width)
+        pygame.draw.circle(es, color, (c, c), 2)
+        frames.append(es.convert_alpha())
+    return frames
+
 class Enemy:
+    __slots__ = ("x","y","r","hp","color","dx","dy","turn_bias","shoot_t","spin","angle","rep_cd")
     def __init__(self, pos, r, hp, color):
-        self.pos = pygame.Vector2(pos)
+        self.x, self.y = float(pos[0]), float(pos[1])
         self.r = r
         self.hp = hp
         self.color = color
-        self.dir = random.choice([pygame.Vector2(1,0), pygame.Vector2(-1,0), pygame.Vector2(0,1), pygame.Vector2(0,-1)])
+        self.dx, self.dy = random.choice(CARDINALS)
         self.turn_bias = 0.25
         self.shoot_t = rand_between((1.0, 1.6))
         self.spin = random.uniform(-2.0, 2.0)
         self.angle = random.random() * TAU
         self.rep_cd = 0.0  # mitosis cooldown
 
+    def snap(self):
+        self.x, self.y = snap_axis(self.x, self.y, self.dx, self.dy)
+
     def common_move(self, dt, speed):
         # Lock to wire and move; consider turning at intersections
-        snap_axis(self.pos, self.dir)
-        self.pos += self.dir * speed * dt
+        self.snap()
+        step = speed * dt
+        self.x += self.dx * step
+        self.y += self.dy * step
         # world bounds bounce
-        if self.pos.x < 12 or self.pos.x > W-12:
-            self.pos.x = clamp(self.pos.x, 12, W-12)
-            self.dir.x *= -1; snap_axis(self.pos, self.dir)
-        if self.pos.y < 12 or self.pos.y > H-12:
-            self.pos.y = clamp(self.pos.y, 12, H-12)
-            self.dir.y *= -1; snap_axis(self.pos, self.dir)
+        if self.x < 12 or self.x > W-12:
+            self.x = clamp(self.x, 12, W-12)
+            self.dx = -self.dx; self.snap()
+        if self.y < 12 or self.y > H-12:
+            self.y = clamp(self.y, 12, H-12)
+            self.dy = -self.dy; self.snap()
         # random turn at intersections
-        if at_intersection(self.pos) and random.random() < self.turn_bias * dt * 60:
-            if abs(self.dir.x) > 0:
-                self.dir = random.choice([pygame.Vector2(0,1), pygame.Vector2(0,-1)])
+        if at_intersection(self.x, self.y) and random.random() < self.turn_bias * dt * 60:
+            if self.dx:
+                self.dx, self.dy = random.choice(V_CARD)
             else:
-                self.dir = random.choice([pygame.Vector2(1,0), pygame.Vector2(-1,0)])
-            snap_axis(self.pos, self.dir)
+                self.dx, self.dy = random.choice(H_CARD)
+            self.snap()
         # mitosis cooldown
         if self.rep_cd > 0.0:
             self.rep_cd = max(0.0, self.rep_cd - dt)
@@ -328,20 +414,20 @@ class Enemy:
         self.hp -= dmg
         return self.hp <= 0
 
-    def draw_base(self, surf, width=2):
-        # rotating diamond ring
+    ring_w = 2  # diamond outline width
+
+    def sprite(self, cache):
         self.angle += self.spin / 60.0
-        ca, sa = math.cos(self.angle), math.sin(self.angle)
-        r = self.r
-        pts = []
-        for px, py in ((0,-r),(r,0),(0,r),(-r,0)):
-            x = px * ca - py * sa
-            y = px * sa + py * ca
-            pts.append((self.pos.x + x, self.pos.y + y))
-        pygame.draw.polygon(surf, self.color, pts, width)
-        pygame.draw.circle(surf, self.color, (int(self.pos.x), int(self.pos.y)), 2)
+        key = (self.r, self.color, self.ring_w)
+        frames = cache.get(key)
+        if frames is None:
+            frames = cache[key] = make_enemy_sprites(*key)
+        k = round((self.angle % QUARTER_TURN) / QUARTER_TURN * ENEMY_ROT_STEPS) % ENEMY_ROT_STEPS
+        c = self.r + self.ring_w + 1
+        return frames[k], (int(self.x) - c, int(self.y) - c)
 
 class Virus(Enemy):
+    __slots__ = ("tier",)
     def __init__(self, pos, tier=2):
         r = VIRUS_BASE_R if tier==2 else (VIRUS_BASE_R-6 if tier==1 else VIRUS_BASE_R-10)
         hp = 3 if tier==2 else (2 if tier==1 else 1)
@@ -355,8 +441,8 @@ class Virus(Enemy):
         self.shoot_t -= dt
         shots = []
         if self.shoot_t <= 0.0:
-            for d in [pygame.Vector2(1,0), pygame.Vector2(-1,0), pygame.Vector2(0,1), pygame.Vector2(0,-1)]:
-                shots.append(Surge(self.pos, d, SURGE_SPEED_ENEMY, "enemy", HOSTILE_RED))
+            for d in CARDINALS:
+                shots.append(Surge((self.x, self.y), d, SURGE_SPEED_ENEMY, "enemy", HOSTILE_RED))
             self.shoot_t = rand_between(VIRUS_SHOOT_CD)
             game.sfx.play("enemyfire")
             game.add_shake(2.0)
@@ -365,13 +451,12 @@ class Virus(Enemy):
         children = []
         if self.tier > 0:
             for _ in range(2):
-                children.append(Virus(self.pos + pygame.Vector2(random.uniform(-10,10), random.uniform(-10,10)),
+                children.append(Virus((self.x + random.uniform(-10,10), self.y + random.uniform(-10,10)),
                                       tier=self.tier-1))
         return children
-    def draw(self, surf):
-        self.draw_base(surf, width=2)
 
 class Bug(Enemy):
+    __slots__ = ()
     def __init__(self, pos):
         super().__init__(pos, BUG_R, 2, NEON_GREEN)
         self.turn_bias = 0.45
@@ -381,17 +466,15 @@ class Bug(Enemy):
         self.shoot_t -= dt
         shots = []
         if self.shoot_t <= 0.0:
-            to_hero = game.hero.pos - self.pos
-            d = cardinal_from(to_hero)
-            shots.append(Surge(self.pos, d, SURGE_SPEED_ENEMY*1.05, "enemy", NEON_YELLOW))
+            d = cardinal_from(game.hero.x - self.x, game.hero.y - self.y)
+            shots.append(Surge((self.x, self.y), d, SURGE_SPEED_ENEMY*1.05, "enemy", NEON_YELLOW))
             self.shoot_t = rand_between(BUG_SHOOT_CD)
             game.sfx.play("enemyfire")
         return shots
-    def draw(self, surf):
-        self.draw_base(surf, width=2)
-        pygame.draw.circle(surf, self.color, (int(self.pos.x), int(self.pos.y)), 1)
 
 class Worm(Enemy):
+    __slots__ = ("drop_t",)
+    ring_w = 3
     def __init__(self, pos):
         super().__init__(pos, WORM_R, 4, NEON_PURPLE)
         self.turn_bias = 0.22
@@ -402,31 +485,28 @@ class Worm(Enemy):
         shots = []
         self.drop_t -= dt
         if self.drop_t <= 0.0:
-            game.spawn_glitch(self.pos)
+            game.spawn_glitch((self.x, self.y))
             self.drop_t = random.uniform(0.35, 0.65)
         self.shoot_t -= dt
         if self.shoot_t <= 0.0:
-            axis = 0 if abs(self.dir.x) > 0 else 1
-            dirs = [pygame.Vector2(1,0), pygame.Vector2(-1,0)] if axis==0 else [pygame.Vector2(0,1), pygame.Vector2(0,-1)]
-            for d in dirs:
-                shots.append(Surge(self.pos, d, SURGE_SPEED_ENEMY*0.95, "enemy", HOSTILE_RED))
+            axis = 0 if self.dx else 1
+            for d in (H_CARD if axis==0 else V_CARD):
+                shots.append(Surge((self.x, self.y), d, SURGE_SPEED_ENEMY*0.95, "enemy", HOSTILE_RED))
             self.shoot_t = rand_between(WORM_SHOOT_CD)
             game.sfx.play("enemyfire")
             game.add_shake(2.0)
         return shots
-    def draw(self, surf):
-        self.draw_base(surf, width=3)
 
 # ---------- Hero ----------
 class Hero:
+    __slots__ = ("x","y","r","hp","ifr","cd","face","oc_meter")
     def __init__(self, pos):
-        self.pos = pygame.Vector2(pos)
-        self.vel = pygame.Vector2()
+        self.x, self.y = float(pos[0]), float(pos[1])
         self.r = HERO_R
-               self.hp = HERO_HP
+        self.hp = HERO_HP
         self.ifr = 0.0
         self.cd = 0.0
-        self.face = pygame.Vector2(1,0)
+        self.face = (1, 0)
         self.oc_meter = 0  # 0..OC_MAX
 
     def alive(self):
@@ -448,17 +528,20 @@ class Hero:
         self.oc_meter = 0
 
     def update(self, dt, keys):
-        move = pygame.Vector2(0,0)
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:  move.x -= 1
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]: move.x += 1
-        if keys[pygame.K_w] or keys[pygame.K_UP]:    move.y -= 1
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:  move.y += 1
-        if move.length_squared() > 0:
-            move = move.normalize()
-            self.pos += move * HERO_SPEED * dt
-            self.face = cardinal_from(move)
-        self.pos.x = clamp(self.pos.x, 12, W-12)
-        self.pos.y = clamp(self.pos.y, 12, H-12)
+        mx = my = 0
+        if keys[pygame.K_a] or keys[pygame.K_LEFT]:  mx -= 1
+        if keys[pygame.K_d] or keys[pygame.K_RIGHT]: mx += 1
+        if keys[pygame.K_w] or keys[pygame.K_UP]:    my -= 1
+        if keys[pygame.K_s] or keys[pygame.K_DOWN]:  my += 1
+        if mx or my:
+            step = HERO_SPEED * dt
+            if mx and my:
+                step *= INV_SQRT2  # normalized diagonal
+            self.x += mx * step
+            self.y += my * step
+            self.face = (mx, 0) if mx else (0, my)
+        self.x = clamp(self.x, 12, W-12)
+        self.y = clamp(self.y, 12, H-12)
         if self.ifr > 0.0: self.ifr = max(0.0, self.ifr - dt)
         if self.cd > 0.0:  self.cd = max(0.0, self.cd - dt)
 
@@ -468,14 +551,15 @@ class Hero:
     def shoot(self, aim_dir, overclock=False):
         # Overclock no longer affects normal shots; it's now a separate BLAST.
         self.cd = HERO_SHOT_CD
-        dirv = cardinal_from(aim_dir if aim_dir.length_squared() > 0 else self.face)
-        return Surge(self.pos, dirv, SURGE_SPEED_PLAYER, "player", NEON_CYAN, r=SURGE_R)
+        ax, ay = aim_dir if (aim_dir[0] or aim_dir[1]) else self.face
+        dirv = cardinal_from(ax, ay)
+        return Surge((self.x, self.y), dirv, SURGE_SPEED_PLAYER, "player", NEON_CYAN, r=SURGE_R)
 
     def draw(self, surf):
         col = NEON_CYAN if (self.ifr <= 0 or int(self.ifr*20)%2==0) else (140, 160, 160)
-        pygame.draw.circle(surf, col, (int(self.pos.x), int(self.pos.y)), self.r)
-        tip = self.pos + self.face * (self.r + 4)
-        pygame.draw.line(surf, col, self.pos, tip, 2)
+        pygame.draw.circle(surf, col, (int(self.x), int(self.y)), self.r)
+        tip = (self.x + self.face[0] * (self.r + 4), self.y + self.face[1] * (self.r + 4))
+        pygame.draw.line(surf, col, (self.x, self.y), tip, 2)
 
 # ---------- Natural surge trains ----------
 class SurgeEmitter:
@@ -484,7 +568,7 @@ class SurgeEmitter:
         self.axis = row_or_col  # "row" (left<->right) or "col" (up<->down)
         self.fire_t = 0.0
         self.x_or_y = 0.0
-        self.dir = pygame.Vector2(1,0)
+        self.dir = (1, 0)
         self.count = 0
         self.active = False
 
@@ -493,10 +577,10 @@ class SurgeEmitter:
         self.count = random.randint(6, 10)
         if self.axis == "row":
             self.x_or_y = random.randint(2, (H-2)//GRID - 2) * GRID
-            self.dir = pygame.Vector2(1,0) if random.random() < 0.5 else pygame.Vector2(-1,0)
+            self.dir = H_CARD[0] if random.random() < 0.5 else H_CARD[1]
         else:
             self.x_or_y = random.randint(2, (W-2)//GRID - 2) * GRID
-            self.dir = pygame.Vector2(0,1) if random.random() < 0.5 else pygame.Vector2(0,-1)
+            self.dir = V_CARD[0] if random.random() < 0.5 else V_CARD[1]
         self.fire_t = 0.0
 
     def update(self, dt, game):
@@ -506,20 +590,114 @@ class SurgeEmitter:
             self.fire_t = 0.07  # packet spacing
             self.count -= 1
             if self.axis == "row":
-                pos = pygame.Vector2(12 if self.dir.x > 0 else W-12, self.x_or_y)
+                pos = (12 if self.dir[0] > 0 else W-12, self.x_or_y)
             else:
-                pos = pygame.Vector2(self.x_or_y, 12 if self.dir.y > 0 else H-12)
+                pos = (self.x_or_y, 12 if self.dir[1] > 0 else H-12)
             game.surges.append(Surge(pos, self.dir, SURGE_SPEED_NATURAL, "natural", NAT_ORANGE))
             game.sfx.play("natural")
         if self.count <= 0:
             self.active = False
 
+# ---------- Per-frame kernels ----------
+# Plain numeric loops kept free of pygame calls and Game state; Game applies
+# their results (spawning, sounds, sparks).
+def integrate_surges(surges, dt):
+    """Move, snap and age every surge in one pass; returns the survivors."""
+    alive = []
+    for s in surges:
+        x = s.x
+        y = s.y
+        h = s.trail_head
+        s.trail[h] = x
+        s.trail[h + 1] = y
+        s.trail_head = (h + 2) % (2 * TRAIL_LEN)
+        if s.trail_n < TRAIL_LEN:
+            s.trail_n += 1
+        step = s.speed * dt
+        x += s.dx * step
+        y += s.dy * step
+        # stay on a grid wire (snap_axis inlined: this runs per surge per frame)
+        if s.dx: y = round(y * INV_GRID) * GRID
+        if s.dy: x = round(x * INV_GRID) * GRID
+        s.x = x
+        s.y = y
+        s.ttl -= dt
+        if s.ttl > 0 and -20 < x < W+20 and -20 < y < H+20:
+            alive.append(s)
+    return alive
+
+def touching_pairs(enemies):
+    """Index pairs (i, j) of same-type enemies whose circles touch."""
+    buckets = {}
+    for i, e in enumerate(enemies):
+        key = (int(e.x // MITOSIS_CELL), int(e.y // MITOSIS_CELL), type(e))
+        buckets.setdefault(key, []).append(i)
+    pairs = []
+    for (cx, cy, kind), cell in buckets.items():
+        for ox, oy in ((0,0), (1,0), (0,1), (1,1), (-1,1)):
+            other = cell if (ox, oy) == (0, 0) else buckets.get((cx+ox, cy+oy, kind))
+            if not other:
+                continue
+            for a, i in enumerate(cell):
+                ei = enemies[i]
+                xi, yi, ri = ei.x, ei.y, ei.r
+                for j in (other[a+1:] if other is cell else other):
+                    ej = enemies[j]
+                    dx = xi - ej.x
+                    dy = yi - ej.y
+                    rr = ri + ej.r
+                    if dx*dx + dy*dy <= rr*rr:
+                        pairs.append((i, j) if i < j else (j, i))
+    pairs.sort()  # resolve in (i < j) index order, as the all-pairs loop did
+    return pairs
+
+def hit_pairs(sx, sy, sr, friendly, ex, ey, er, grid):
+    """(enemy, surge) index pairs whose circles overlap, sorted enemy-major."""
+    grid.clear()
+    cell_at = grid.get
+    for i in friendly:
+        key = (int(sx[i] // HIT_CELL), int(sy[i] // HIT_CELL))
+        cell = cell_at(key)
+        if cell is None:
+            grid[key] = [i]
+        else:
+            cell.append(i)
+    pairs = []
+    if not grid:
+        return pairs
+    for j in range(len(ex)):
+        x, y, r = ex[j], ey[j], er[j]
+        cx = int(x // HIT_CELL)
+        cy = int(y // HIT_CELL)
+        near = []
+        for ox in (-1, 0, 1):
+            for oy in (-1, 0, 1):
+                cell = cell_at((cx+ox, cy+oy))
+                if cell:
+                    near.extend(cell)
+        if not near:
+            continue
+        near.sort()
+        for i in near:
+            dx = x - sx[i]
+            dy = y - sy[i]
+            rr = r + sr[i]
+            if dx*dx + dy*dy <= rr*rr:
+                pairs.append((j, i))
+    return pairs
+
 # ---------- Game ----------
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED]
+
 class Game:
     def __init__(self):
         pygame.init()
         pygame.display.set_caption("OVERCLOCK — Cyber Circuit Shooter")
         self.screen = pygame.display.set_mode((W, H))
+        # Only queue the event types handle_events reacts to; held keys and the mouse are
+        # read as state in poll_input, so motion/keyup/window events never get allocated.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont("arial", 18, bold=True)
         self.bigfont = pygame.font.SysFont("arial", 48, bold=True)
@@ -528,8 +706,23 @@ class Game:
         self.fancy_vfx = FANCY_VFX_DEFAULT
         self.sfx = SFX()
 
-        self.world = pygame.Surface((W, H), pygame.SRCALPHA)
-        self.hud_layer = pygame.Surface((W, H), pygame.SRCALPHA)
+        # The world is fully covered by the opaque background every frame, so it needs no
+        # alpha channel; only the HUD layer is composited with transparency.
+        self.world = pygame.Surface((W, H)).convert()
+        self.hud_layer = pygame.Surface((W, H), pygame.SRCALPHA).convert_alpha()
+        # HUD boxes never move; only the meter fill's width changes per frame
+        self._hp_rects = [pygame.Rect(12 + i*18, 36, 14, 8) for i in range(HERO_HP)]
+        self._oc_back_rect = pygame.Rect(W-202, 36, 190, 8)
+        self._oc_fill_rect = pygame.Rect(W-202, 36, 0, 8)
+        # Bloom scratch buffers, reused every frame (same format as the world for smoothscale)
+        self._bloom_small = pygame.Surface((W // BLOOM_DOWNSCALE, H // BLOOM_DOWNSCALE)).convert()
+        self._bloom_big = pygame.Surface((W, H)).convert()
+        self._surge_sprites = {}   # (r, color) -> head dot
+        self._glitch_sprites = make_glitch_sprites()
+        self._enemy_sprites = {}   # (r, color, ring width) -> rotation frames
+        self._view = None          # (state, vfx, scanlines) shown by the last frame
+        self._dirty = []           # screen areas that last partial update touched
+        self._grid = {}            # (cell x, cell y) -> friendly surge indices, rebuilt each frame
 
         self.state = "menu"  # "menu","play","paused","gameover","sectorclear"
         self.sector = 1
@@ -546,8 +739,15 @@ class Game:
         # Overclock blast state
         self.oc_blast_timer = 0.0
 
-        # Background "traces"
+        # Per-frame snapshots, refreshed once at the top of each frame (see poll_input)
+        self.input = (None, (0, 0), (False, False, False))  # keys, mouse pos, mouse buttons
+        self.t_ms = 0
+
+        # Background "traces": static layer baked once, glow dots animated per frame
         self.trace_paths = self.build_traces()
+        self.trace_ends = [self.measure_trace(pts) for pts in self.trace_paths]
+        self._bg_static = self.bake_circuit_bg()
+        self._glow_dot = make_dot_sprite(3, GRID_GLOW)
 
         # Natural surge timing
         self.nat_timer = rand_between(NAT_SURGE_EVERY)
@@ -565,45 +765,66 @@ class Game:
             length = random.randint(3, 7)
             px = random.randint(1, (W-2)//GRID - 2) * GRID
             py = random.randint(1, (H-2)//GRID - 2) * GRID
-            p = pygame.Vector2(px, py)
-            dirv = random.choice([pygame.Vector2(1,0), pygame.Vector2(-1,0), pygame.Vector2(0,1), pygame.Vector2(0,-1)])
-            pts = [p.copy()]
+            dx, dy = random.choice(CARDINALS)
+            pts = [pygame.Vector2(px, py)]
             for _ in range(length):
                 if random.random() < 0.5:
-                    dirv = pygame.Vector2(dirv.y, dirv.x)  # 90°
+                    dx, dy = dy, dx  # 90°
                     if random.random() < 0.5:
-                        dirv *= -1
-                p = p + dirv * GRID
-                p.x = clamp(p.x, GRID, W-GRID)
-                p.y = clamp(p.y, GRID, H-GRID)
-                pts.append(p.copy())
+                        dx, dy = -dx, -dy
+                px = clamp(px + dx * GRID, GRID, W-GRID)
+                py = clamp(py + dy * GRID, GRID, H-GRID)
+                pts.append(pygame.Vector2(px, py))
             paths.append(pts)
         return paths
 
-    def draw_circuit_bg(self, surf, t):
-        surf.fill(VERY_DARK)
+    def measure_trace(self, pts):
+        """Cumulative length at the end of each segment of a trace."""
+        ends = []
+        total = 0.0
+        for i in range(len(pts)-1):
+            a, b = pts[i], pts[i+1]
+            total += abs(b.x - a.x) + abs(b.y - a.y)
+            ends.append(total)
+        return ends
+
+    def bake_circuit_bg(self):
+        """Grid and copper traces never move, so they are drawn once into an opaque layer."""
+        bg = pygame.Surface((W, H)).convert()
+        bg.fill(VERY_DARK)
         col = GRID_DARK
         for x in range(GRID, W, GRID):
-            pygame.draw.line(surf, col, (x, 0), (x, H), 1)
+            pygame.draw.line(bg, col, (x, 0), (x, H), 1)
         for y in range(GRID, H, GRID):
-            pygame.draw.line(surf, col, (0, y), (W, y), 1)
+            pygame.draw.line(bg, col, (0, y), (W, y), 1)
         for pts in self.trace_paths:
             for i in range(len(pts)-1):
                 a, b = pts[i], pts[i+1]
-                pygame.draw.line(surf, (30, 120, 160), a, b, 2)
-            if len(pts) >= 2:
-                segs = [(pts[i], pts[i+1]) for i in range(len(pts)-1)]
-                total = sum((a.distance_to(b) for a,b in segs))
-                mu = (t * 160) % max(total, 1)
-                for a,b in segs:
-                    seg_len = a.distance_to(b)
-                    if mu <= seg_len:
-                        d = (mu/seg_len) if seg_len > 0 else 0
-                        px = a.x + (b.x - a.x)*d
-                        py = a.y + (b.y - a.y)*d
-                        pygame.draw.circle(surf, GRID_GLOW, (int(px), int(py)), 3)
-                        break
-                    mu -= seg_len
+                pygame.draw.line(bg, (30, 120, 160), a, b, 2)
+        return bg
+
+    def draw_circuit_bg(self, surf, t):
+        """Static layer plus the travelling glow dots; returns the dots' (sprite, dest) pairs."""
+        surf.blit(self._bg_static, (0, 0))
+        # one glow dot travelling along each trace, all blitted in one batch
+        dot = self._glow_dot
+        dots = []
+        for pts, ends in zip(self.trace_paths, self.trace_ends):
+            if not ends:
+                continue
+            mu = (t * 160) % max(ends[-1], 1)
+            k = bisect_left(ends, mu)
+            if k == len(ends):
+                continue
+            a, b = pts[k], pts[k+1]
+            start = ends[k-1] if k else 0.0
+            seg_len = ends[k] - start
+            d = ((mu - start)/seg_len) if seg_len > 0 else 0
+            px = a.x + (b.x - a.x)*d
+            py = a.y + (b.y - a.y)*d
+            dots.append((dot, (int(px) - 3, int(py) - 3)))
+        blit_batch(surf, dots)
+        return dots
 
     # ---- Effects ----
     def add_shake(self, amount):
@@ -618,7 +839,7 @@ class Game:
             self.particles.append(Particle(pos, vel, random.uniform(0.25, 0.5), color, size=random.choice([1,2,2,3])))
 
     def spawn_glitch(self, pos):
-        self.glitches.append([pos.copy(), 1.0])
+        self.glitches.append([pygame.Vector2(pos), 1.0])
 
     # ---- Sector / Spawning ----
     def build_sector(self, n_virus, n_bug, n_worm):
@@ -644,11 +865,16 @@ class Game:
         return pygame.Vector2(x, y)
 
     # ---- Game Loop ----
+    def poll_input(self):
+        self.t_ms = pygame.time.get_ticks()
+        self.input = (pygame.key.get_pressed(), pygame.mouse.get_pos(), pygame.mouse.get_pressed())
+
     def run(self):
         while True:
             dt = self.clock.tick(FPS) / 1000.0
             if not self.handle_events():
                 return
+            self.poll_input()
             if self.state == "paused":
                 self.draw()
                 continue
@@ -662,7 +888,7 @@ class Game:
         if self.state in ("gameover", "sectorclear"):
             return
 
-        keys = pygame.key.get_pressed()
+        keys, (mx, my), buttons = self.input
 
         # Hero
         self.hero.update(dt, keys)
@@ -681,9 +907,8 @@ class Game:
             self.add_shake(OC_BLAST_SHAKE_STRENGTH * 0.75)
 
         # Normal firing
-        mouse = pygame.Vector2(pygame.mouse.get_pos())
-        aim = mouse - self.hero.pos
-        if (pygame.mouse.get_pressed()[0] or keys[pygame.K_SPACE]) and self.hero.can_shoot():
+        aim = (mx - self.hero.x, my - self.hero.y)
+        if (buttons[0] or keys[pygame.K_SPACE]) and self.hero.can_shoot():
             surge = self.hero.shoot(aim)
             self.surges.append(surge)
             self.sfx.play("fire")
@@ -708,24 +933,28 @@ class Game:
         # Enemy mitosis (same-type touch spawns a third)
         self.handle_enemy_mitosis()
 
-        # Glitches decay
-        self.glitches = [[p, max(0.0, a - dt*0.5)] for (p,a) in self.glitches if a - dt*0.5 > 0.0]
+        # Glitches decay (in place; entries are mutable [pos, alpha] pairs)
+        fade = dt * 0.5
+        def decay(g):
+            g[1] -= fade
+            return g[1] > 0.0
+        compact(self.glitches, decay)
 
         # Surges move
-        self.surges = [s for s in self.surges if s.update(dt)]
+        self.surges = integrate_surges(self.surges, dt)
 
         # Particles update
-        self.particles = [p for p in self.particles if p.update(dt)]
+        compact(self.particles, lambda p: p.update(dt))
 
-        # Collisions: surge vs surge (cancel)
-        self.handle_surge_cancels()
-
-        # Surge hits
-        self.handle_surge_hits()
+        # Collisions: surge vs surge (cancel), then surge hits; cancelled surges are
+        # only marked, and the list is compacted once at the end of the hit pass
+        spent = self.handle_surge_cancels()
+        self.handle_surge_hits(spent)
 
         # Glitch hazards vs hero
+        hx, hy, hr = self.hero.x, self.hero.y, self.hero.r + 7
         for (gp, alpha) in self.glitches:
-            if self.hero.pos.distance_to(gp) <= (self.hero.r + 7):
+            if within(gp.x, gp.y, hx, hy, hr):
                 if self.hero.hurt():
                     self.sfx.play("hurt")
                     self.add_shake(5.0)
@@ -745,113 +974,178 @@ class Game:
             self.shake = max(0.0, self.shake - SHAKE_DECAY * (1.0/FPS))
 
     def fire_overclock_blast(self):
-        pos = self.hero.pos.copy()
-        dirs = [pygame.Vector2(1,0), pygame.Vector2(-1,0), pygame.Vector2(0,1), pygame.Vector2(0,-1)]
-        for d in dirs:
+        pos = (self.hero.x, self.hero.y)
+        for d in CARDINALS:
             self.surges.append(
                 Surge(pos, d, OC_SURGE_SPEED, "oc", NEON_YELLOW,
                       r=OC_SURGE_R, ttl=OC_SURGE_TTL, dmg=OC_SURGE_DMG, pierce=True)
             )
         self.hero.reset_overclock()
         self.sfx.play("over_on")
-        self.spark(self.hero.pos, NEON_YELLOW, n=14)
+        self.spark(pos, NEON_YELLOW, n=14)
 
     def handle_enemy_mitosis(self):
-        n = len(self.enemies)
+        enemies = self.enemies
         to_add = []
-        for i in range(n):
-            ei = self.enemies[i]
-            for j in range(i+1, n):
-                ej = self.enemies[j]
-                if type(ei) is not type(ej):
-                    continue
-                if ei.rep_cd > 0.0 or ej.rep_cd > 0.0:
-                    continue
-                if ei.pos.distance_to(ej.pos) <= (ei.r + ej.r):
-                    if len(self.enemies) + len(to_add) >= MAX_ENEMIES_ON_FIELD:
-                        continue
-                    pos = (ei.pos + ej.pos) / 2 + pygame.Vector2(random.uniform(-6,6), random.uniform(-6,6))
-                    # spawn same type
-                    if isinstance(ei, Virus):
-                        child = Virus(pos, tier=getattr(ei, "tier", 1))
-                    elif isinstance(ei, Bug):
-                        child = Bug(pos)
-                    else:
-                        child = Worm(pos)
-                    child.rep_cd = 0.75
-                    ei.rep_cd = 0.75
-                    ej.rep_cd = 0.75
-                    to_add.append(child)
-                    self.sfx.play("clone")
-                    self.spark(pos, (180, 220, 255), 10)
+        for i, j in touching_pairs(enemies):
+            ei = enemies[i]
+            ej = enemies[j]
+            if ei.rep_cd > 0.0 or ej.rep_cd > 0.0:
+                continue
+            if len(enemies) + len(to_add) >= MAX_ENEMIES_ON_FIELD:
+                continue
+            pos = ((ei.x + ej.x) / 2 + random.uniform(-6,6), (ei.y + ej.y) / 2 + random.uniform(-6,6))
+            # spawn same type
+            if isinstance(ei, Virus):
+                child = Virus(pos, tier=ei.tier)
+            elif isinstance(ei, Bug):
+                child = Bug(pos)
+            else:
+                child = Worm(pos)
+            child.rep_cd = 0.75
+            ei.rep_cd = 0.75
+            ej.rep_cd = 0.75
+            to_add.append(child)
+            self.sfx.play("clone")
+            self.spark(pos, (180, 220, 255), 10)
         if to_add:
-            self.enemies.extend(to_add)
+            enemies.extend(to_add)
 
     def handle_surge_cancels(self):
+        """Indices of surges cancelled this frame (left in place for handle_surge_hits)."""
+        # Only friendly (player/oc) vs hostile (enemy/natural) pairs clash; most
+        # frames have one side empty, which needs no pair work at all.
+        surges = self.surges
         dead = set()
-        for i in range(len(self.surges)):
-            if i in dead: continue
-            si = self.surges[i]
-            for j in range(i+1, len(self.surges)):
-                if j in dead: continue
-                sj = self.surges[j]
-                # clash if one is player/oc and the other is enemy/natural
-                def is_friend(o): return o in ("player", "oc")
-                def is_foe(o):    return o in ("enemy", "natural")
-                if (is_friend(si.owner) and is_foe(sj.owner)) or (is_friend(sj.owner) and is_foe(si.owner)):
-                    if si.pos.distance_to(sj.pos) <= (si.r + sj.r + 1):
-                        # If OVERCLOCK surge involved, it pierces (kill foe only)
-                        if si.owner == "oc" and is_foe(sj.owner):
-                            dead.add(j)
-                        elif sj.owner == "oc" and is_foe(si.owner):
-                            dead.add(i)
-                        else:
-                            dead.add(i); dead.add(j)
-                        self.sfx.play("cancel")
-                        self.spark((si.pos+sj.pos)/2, (140, 200, 255))
-                        # Only normal player cancels feed the meter
-                        if ("player" in (si.owner, sj.owner)):
-                            self.hero.add_oc(OC_FILL_PER_CANCEL)
-        if dead:
-            self.surges = [s for k,s in enumerate(self.surges) if k not in dead]
-
-    def handle_surge_hits(self):
-        # Iterate on a copy; remove from original safely
-        for s in list(self.surges):
-            if s.owner in ("player", "oc"):
-                # Enemy hit
-                for e in list(self.enemies):
-                    if e.pos.distance_to(s.pos) <= (e.r + s.r):
-                        died = e.take_damage(s.dmg)
-                        self.sfx.play("hit")
-                        self.spark(s.pos, NEON_CYAN if s.owner=="player" else NEON_YELLOW, 10)
-                        if s.owner == "player":
-                            self.score += 45
-                            self.hero.add_oc(OC_FILL_PER_KILL)
-                        else:
-                            self.score += 35
-                        if died:
-                            self.sfx.play("explode")
-                            self.spark(e.pos, e.color, 18)
-                            self.enemies.remove(e)
-                            if isinstance(e, Virus):
-                                for child in e.on_death():
-                                    if len(self.enemies) < MAX_ENEMIES_ON_FIELD:
-                                        self.enemies.append(child)
-                            self.score += 120 if s.owner=="player" else 90
-                        if not s.pierce:
-                            if s in self.surges:
-                                self.surges.remove(s)
-                            break
+        n_friend = sum(1 for s in surges if s.owner in FRIENDLY_OWNERS)
+        if n_friend == 0 or n_friend == len(surges):
+            return dead
+        # Surges are cardinal and locked to a wire, so two can only clash on the
+        # same lane (row for horizontal movers, column for vertical ones) or, for
+        # a crossing pair, around the same junction. Cancel reach (r + r + 1)
+        # stays under GRID/2, so rounding to the nearest junction never misses.
+        # Each bucket holds (friend indices, foe indices).
+        # Candidate pairs are then resolved in the original all-pairs (i < j) order.
+        lanes = {}
+        junctions = {}
+        for i, s in enumerate(surges):
+            side = 0 if s.owner in FRIENDLY_OWNERS else 1
+            jx = round(s.x / GRID)
+            jy = round(s.y / GRID)
+            key = (0, jy) if s.dx else (1, jx)
+            group = lanes.get(key)
+            if group is None:
+                group = lanes[key] = ([], [])
+            group[side].append(i)
+            group = junctions.get((jx, jy))
+            if group is None:
+                group = junctions[(jx, jy)] = ([], [])
+            group[side].append(i)
+        pairs = set()
+        for friends, foes in lanes.values():
+            for i in friends:
+                for j in foes:
+                    pairs.add((i, j) if i < j else (j, i))
+        for friends, foes in junctions.values():
+            for i in friends:
+                horiz = surges[i].dx != 0
+                for j in foes:
+                    if (surges[j].dx != 0) != horiz:  # same-axis pairs were covered by the lanes
+                        pairs.add((i, j) if i < j else (j, i))
+        # The lower surge of a pair is only skipped if it was already dead when its
+        # row started; one that dies within its row keeps cancelling the rest.
+        row = -1
+        row_dead = False
+        for a, b in sorted(pairs):
+            if a != row:
+                row = a
+                row_dead = a in dead
+            if row_dead or b in dead:
+                continue
+            if surges[a].owner in FRIENDLY_OWNERS:
+                self.try_cancel(a, b, dead)
+            else:
+                self.try_cancel(b, a, dead)
+        return dead
+
+    def try_cancel(self, i, j, dead):
+        """Resolve friendly surge i meeting hostile surge j."""
+        si = self.surges[i]
+        sj = self.surges[j]
+        dx = si.x - sj.x
+        dy = si.y - sj.y
+        rr = si.r + sj.r + 1
+        if dx*dx + dy*dy <= rr*rr:
+            # If OVERCLOCK surge involved, it pierces (kill foe only)
+            if si.owner == "oc":
+                dead.add(j)
+            else:
+                dead.add(i); dead.add(j)
+            self.sfx.play("cancel")
+            self.spark(((si.x+sj.x)/2, (si.y+sj.y)/2), (140, 200, 255))
+            # Only normal player cancels feed the meter
+            if si.owner == "player":
+                self.hero.add_oc(OC_FILL_PER_CANCEL)
+
+    def handle_surge_hits(self, spent):
+        """Resolve surges against enemies and the hero, then drop every spent surge."""
+        surges = self.surges
+        enemies = self.enemies
+        hero = self.hero
+        play = self.sfx.play
+        spark = self.spark
+        score = 0      # folded into self.score once at the end
+        slain = set()  # enemy indices killed this frame; likewise removed at the end
+        sx = [s.x for s in surges]
+        sy = [s.y for s in surges]
+        sr = [s.r for s in surges]
+        friendly = [i for i, s in enumerate(surges) if s.owner in FRIENDLY_OWNERS and i not in spent]
+        pairs = ()
+        if friendly and enemies:
+            pairs = hit_pairs(sx, sy, sr, friendly,
+                              [e.x for e in enemies], [e.y for e in enemies], [e.r for e in enemies],
+                              self._grid)
+        # Apply in (enemy, surge) order: a spent surge can't hit a later enemy and a
+        # dead enemy takes no further hits. Virus children land past the original tail.
+        for j, i in pairs:
+            if j in slain or i in spent:
                 continue
+            e = enemies[j]
+            s = surges[i]
+            died = e.take_damage(s.dmg)
+            play("hit")
+            by_player = s.owner == "player"
+            spark((s.x, s.y), NEON_CYAN if by_player else NEON_YELLOW, 10)
+            if by_player:
+                score += 45
+                hero.add_oc(OC_FILL_PER_KILL)
             else:
-                # Enemy or natural surge hitting hero
-                if self.hero.pos.distance_to(s.pos) <= (self.hero.r + s.r):
-                    if s in self.surges:
-                        self.surges.remove(s)
-                    if self.hero.hurt():
-                        self.sfx.play("hurt")
+                score += 35
+            if not s.pierce:
+                spent.add(i)
+            if died:
+                play("explode")
+                spark((e.x, e.y), e.color, 18)
+                slain.add(j)
+                if isinstance(e, Virus):
+                    for child in e.on_death():
+                        if len(enemies) - len(slain) < MAX_ENEMIES_ON_FIELD:
+                            enemies.append(child)
+                score += 120 if by_player else 90
+        self.score += score
+        # Enemy or natural surge hitting hero
+        hx, hy, hr = hero.x, hero.y, hero.r
+        for i, s in enumerate(surges):
+            if s.owner not in FRIENDLY_OWNERS and i not in spent:
+                if within(hx, hy, sx[i], sy[i], hr + sr[i]):
+                    spent.add(i)
+                    if hero.hurt():
+                        play("hurt")
                         self.add_shake(6.0)
+        if spent:
+            self.surges = [s for k,s in enumerate(surges) if k not in spent]
+        if slain:
+            self.enemies = [e for k,e in enumerate(enemies) if k not in slain]
 
     # ---- Draw ----
     def draw_hud(self, surf):
@@ -859,15 +1153,16 @@ class Game:
         draw_neon_text(surf, status, self.font, (12, 10), HUD_WHITE)
 
         # Integrity (HP)
-        x0, y0 = 12, 36
-        for i in range(HERO_HP):
-            col = NEON_PINK if i < self.hero.hp else (70, 60, 70)
-            pygame.draw.rect(surf, col, pygame.Rect(x0 + i*18, y0, 14, 8))
+        hp = self.hero.hp
+        for i, box in enumerate(self._hp_rects):
+            pygame.draw.rect(surf, NEON_PINK if i < hp else (70, 60, 70), box)
 
         # Overclock meter
         oc = self.hero.oc_meter / OC_MAX
-        pygame.draw.rect(surf, (30,30,38), pygame.Rect(W-202, 36, 190, 8))
-        pygame.draw.rect(surf, NEON_YELLOW, pygame.Rect(W-202, 36, int(190*oc), 8))
+        fill = self._oc_fill_rect
+        fill.width = int(190*oc)
+        pygame.draw.rect(surf, (30,30,38), self._oc_back_rect)
+        pygame.draw.rect(surf, NEON_YELLOW, fill)
         if self.hero.ready_overclock() and self.oc_blast_timer <= 0.0:
             label = "OVERCLOCK READY (SHIFT)"
             col = NEON_YELLOW
@@ -905,27 +1200,43 @@ class Game:
         draw_neon_text(surf, f"Score {self.score}", self.font, (W//2 - 40, H//2 - 10), HUD_WHITE)
         draw_neon_text(surf, "Press SPACE / CLICK to proceed", self.font, (W//2 - 120, H//2 + 20), NEON_YELLOW)
 
+    def draw_surges(self, surf):
+        """Trails straight off the ring buffers, then every head dot in one batch."""
+        line = pygame.draw.line
+        span = 2 * TRAIL_LEN
+        for s in self.surges:
+            n = s.trail_n
+            if n <= 2:
+                continue
+            cols = trail_colors(s.color, n)
+            width = 2 if not s.pierce else 3
+            tr = s.trail
+            k = (s.trail_head - 2 * n) % span   # oldest sample
+            a = (tr[k], tr[k + 1])
+            for i in range(1, n):
+                k = (k + 2) % span
+                b = (tr[k], tr[k + 1])
+                line(surf, cols[i], a, b, width)
+                a = b
+        blit_batch(surf, [s.sprite(self._surge_sprites) for s in self.surges])
+
     def draw(self):
-        t = pygame.time.get_ticks()/1000.0
+        t = self.t_ms/1000.0
 
         # World layer
-        self.world.fill((0,0,0,0))
-        self.draw_circuit_bg(self.world, t)
+        dots = self.draw_circuit_bg(self.world, t)
 
         # Glitches
-        for (gp, alpha) in self.glitches:
-            a = int(200*alpha)
-            ps = pygame.Surface((10,10), pygame.SRCALPHA)
-            pygame.draw.rect(ps, (255, 120, 255, a), pygame.Rect(0,0,10,10))
-            self.world.blit(ps, (gp.x-5, gp.y-5))
+        sprites = self._glitch_sprites
+        blit_batch(self.world, [(sprites[min(GLITCH_STEPS - 1, int(GLITCH_STEPS * alpha))], (gp.x-5, gp.y-5))
+                                for (gp, alpha) in self.glitches])
 
         # Surges
-        for s in self.surges:
-            s.draw(self.world)
+        self.draw_surges(self.world)
 
         # Enemies
-        for e in self.enemies:
-            e.draw(self.world)
+        foes = [e.sprite(self._enemy_sprites) for e in self.enemies]
+        blit_batch(self.world, foes)
 
         # Hero
         if self.hero.alive():
@@ -948,19 +1259,21 @@ class Game:
 
         # Screen shake affects world, not HUD
         ox = oy = 0
-        if self.fancy_vfx and self.shake > 0.0:
-            ox = int(random.uniform(-1.0, 1.0) * self.shake)
-            oy = int(random.uniform(-1.0, 1.0) * self.shake)
+        s = int(self.shake) if self.fancy_vfx else 0
+        if s:
+            ox = _ri(-s, s)
+            oy = _ri(-s, s)
 
-        self.screen.fill(VERY_DARK)
+        if ox or oy:
+            self.screen.fill(VERY_DARK)  # only shake exposes the border
         self.screen.blit(self.world, (ox, oy))
 
         # Bloom
         if self.fancy_vfx:
-            ds = BLOOM_DOWNSCALE
-            glow = pygame.transform.smoothscale(self.world, (W//ds, H//ds))
-            glow = pygame.transform.smoothscale(glow, (W, H))
-            self.screen.blit(glow, (ox, oy), special_flags=pygame.BLEND_ADD)
+            small, big = self._bloom_small, self._bloom_big
+            pygame.transform.smoothscale(self.world, small.get_size(), small)
+            pygame.transform.smoothscale(small, (W, H), big)
+            self.screen.blit(big, (ox, oy), special_flags=pygame.BLEND_ADD)
 
         # No bright overclock overlay; shake covers the BLAST
 
@@ -968,15 +1281,31 @@ class Game:
         self.screen.blit(self.hud_layer, (0, 0))
 
         if self.show_scans:
-            self.screen.blit(self.scanlines, (0, 0))
-
-        pygame.display.flip()
+            blit_batch(self.screen, self.scanlines, pygame.BLEND_RGB_MULT)
+
+        # Outside of play nothing is updated: only the glow dots travel and the enemies
+        # spin, so unshaken frames push just those areas (this frame's and last frame's).
+        # Any shake, a state change or a VFX toggle gets a full flip.
+        view = (self.state, self.fancy_vfx, self.show_scans)
+        dirty = []
+        if self.state != "play":
+            pad = DIRTY_PAD if self.fancy_vfx else 0
+            dirty = [pygame.Rect(dest, spr.get_size()).inflate(pad, pad) for spr, dest in dots]
+            dirty += [pygame.Rect(dest, spr.get_size()).inflate(pad, pad) for spr, dest in foes]
+        if dirty and not (ox or oy) and view == self._view:
+            pygame.display.update(self._dirty + dirty)
+        else:
+            pygame.display.flip()
+        self._view = view
+        self._dirty = dirty
 
     # ---- Input ----
     def handle_events(self):
-        for e in pygame.event.get():
+        for e in pygame.event.get(HANDLED_EVENTS):
             if e.type == pygame.QUIT:
                 return False
+            if e.type == pygame.WINDOWEXPOSED:
+                self._view = None  # window content was damaged: next frame flips in full
             if e.type == pygame.KEYDOWN:
                 if e.key == pygame.K_ESCAPE:
                     return False